@@ -6,17 +6,66 @@ This script extracts technology data from Old World game files and generates
 a single HTML file with an interactive tech tree visualization.
 """
 
-import xml.etree.ElementTree as ET
+import functools
 import hashlib
 import json
 import re
 import os
+import pickle
 import subprocess
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
 import argparse
 
+# lxml is an optional accelerator with the same ElementTree API, backed by
+# libxml2. The stdlib parser is the fallback when it isn't installed.
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+    # ElementTree binds its C parser on import when it exists; without it the
+    # pure-Python parser is an order of magnitude slower, so say so.
+    try:
+        import _elementtree  # noqa: F401
+    except ImportError:
+        print("Warning: C ElementTree accelerator unavailable; XML parsing will be slow")
+
+# libxml2 settings for every parse: the game files carry no DTD entities or
+# meaningful comments, and whitespace-only text nodes just bloat the tree.
+_LXML_OPTIONS = dict(remove_blank_text=True, remove_comments=True,
+                     resolve_entities=False, huge_tree=True, collect_ids=False)
+
+# orjson is an optional accelerator for indented JSON (the tech-data.js
+# nation blocks and --export-json); _dumps_indented() produces the same text
+# either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Text-cleanup patterns, compiled once: clean_text/pretty_text run for every
+# localization entry.
+_MARKUP_RE = re.compile(r'</?[^>]+>|\{[^}]+\}')   # formatting tags and {TEXT_X} substitutions
+_WHITESPACE_RE = re.compile(r'\s+')
+_LINK_RE = re.compile(r'\blink\(([^)]*)\)')
+_ICON_RE = re.compile(r'\bicon\([^)]*\)')
+_MACRO_RE = re.compile(r'\b(?:link|icon)\([^)]*\)')
+_PROJECT_SUFFIX_RE = re.compile(r'\s+\d+$')
+
+
+# Hidden techs containing these are victory techs, shown on the main tree
+# rather than as bonus cards.
+VICTORY_TECH_MARKERS = ("ECONOMIC_REFORM", "MILITARY_PRESTIGE", "INDUSTRIAL_PROGRESS")
+_VICTORY_TECH_RE = re.compile("|".join(VICTORY_TECH_MARKERS))
+
 
 # Version history: maps version hash -> { main: [tech_ids], bonus: [bonus_ids] }
 # When the tech list changes, snapshot the previous version here before regenerating.
@@ -36,50 +85,485 @@ def compute_version_hash(techs, bonus_techs):
     return hashlib.sha256(combined.encode()).hexdigest()[:4]
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_name(text: str, prefix: str) -> str:
+    """Format a game constant name for display (memoized — the same UNIT_/
+    PROJECT_ constants recur across many techs and effects)."""
+    if text.startswith(prefix):
+        text = text[len(prefix):]
+    # Convert underscore to spaces and title case
+    result = text.replace("_", " ").title()
+
+    # Remove upgrade numbers from project names
+    if prefix == "PROJECT_":
+        # Remove " 1", " 2", etc. from the end
+        result = _PROJECT_SUFFIX_RE.sub('', result)
+
+    return result
+
+
+def _clean_text(text: str) -> str:
+    """Store a game-text value in a lightly normalized form.
+
+    Old World's localization strings encode grammatical forms with `~`
+    separators (e.g. "Stone~icon(YIELD_STONE)Stone") plus templating
+    macros: `link(TYPE)` / `link(TYPE,N)` / `icon(TYPE)` and curly
+    substitution like `{TEXT_X}`.
+
+    We keep only the first grammatical form here. We do NOT yet resolve
+    `link()` references because the target text may not be loaded yet —
+    callers go through `pretty_text()` to get a fully resolved label.
+    """
+    if not text:
+        return ""
+
+    text = text.split("~", 1)[0]
+    # Strip HTML-ish formatting tags and curly substitutions in one pass,
+    # but leave link()/icon() macros for pretty_text() to resolve.
+    text = _MARKUP_RE.sub('', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _iter_entries(file_path: Path):
+    """Stream the <Entry> elements of an XML file.
+
+    Each entry is cleared once the caller moves on to the next one, so only a
+    single entry's subtree is alive at a time instead of the whole document.
+    Callers must pull what they need out of an entry before advancing the
+    iterator.
+    """
+    if HAVE_LXML:
+        for _, elem in ET.iterparse(str(file_path), events=("end",), tag="Entry",
+                                    **_LXML_OPTIONS):
+            yield elem
+            elem.clear()
+            # Drop the already-processed siblings still hanging off the root.
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        for _, elem in ET.iterparse(str(file_path), events=("end",)):
+            if elem.tag == "Entry":
+                yield elem
+                elem.clear()
+
+
+def _child_map(node) -> Dict[str, Any]:
+    """{tag: child} for an element's direct children, built in one pass so
+    callers can look fields up instead of running a linear find() for each."""
+    return {child.tag: child for child in node}
+
+
+# Per-file loaders. Each one reads a single XML file and returns plain data
+# without touching parser state, so parse_all() can fan them out to worker
+# processes; the OldWorldParser methods merge the results in a fixed order.
+
+def _load_text_file(file_path: Path) -> Dict[str, str]:
+    """Read any text-*.xml file. Real schema is <zType>…</zType><en-US>…</en-US>."""
+    texts = {}
+    try:
+        for entry in _iter_entries(file_path):
+            # One walk over the entry's children picks up both fields.
+            key = text = None
+            for child in entry:
+                tag = child.tag
+                if tag == "zType":
+                    key = child.text
+                elif tag == "en-US":
+                    text = child.text
+            if key and text:
+                texts[key] = _clean_text(text)
+    except ET.ParseError:
+        pass
+    return texts
+
+
+# Keys of every tech's "unlocks" dict, in output order.
+UNLOCK_KINDS = ("units", "improvements", "laws", "projects", "specialists", "other")
+
+# effectPlayer.xml list tag -> (unlocks key, constant prefix to strip)
+_EFFECT_UNLOCK_TAGS = {
+    "aeUnitUnlock": ("units", "UNIT_"),
+    "aeImprovementUnlock": ("improvements", "IMPROVEMENT_"),
+    "aeLawUnlock": ("laws", "LAW_"),
+    "aeProjectUnlock": ("projects", "PROJECT_"),
+    "aeSpecialistUnlock": ("specialists", "SPECIALIST_"),
+}
+
+
+def _load_effect_player(file_path: Path) -> Dict[str, Dict[str, List[str]]]:
+    """Read effectPlayer.xml into {EFFECTPLAYER_*: unlocks}.
+
+    Each unlocks dict only has the kinds the effect actually grants.
+    """
+    effect_data = {}
+    fmt = _format_name
+    unlock_tags = _EFFECT_UNLOCK_TAGS
+    for entry in _iter_entries(file_path):
+        unlocks = {}
+
+        # One walk over the entry's children: the unlock lists sit directly
+        # under <Entry>, each holding <zValue> items.
+        effect_id = None
+        for child in entry:
+            tag = child.tag
+            if tag == "zType":
+                effect_id = child.text
+                continue
+            spec = unlock_tags.get(tag)
+            if spec is None:
+                continue
+            key, prefix = spec
+            for value in child:
+                if value.tag == "zValue" and value.text:
+                    unlocks.setdefault(key, []).append(fmt(value.text, prefix))
+
+        if effect_id:
+            effect_data[effect_id] = unlocks
+    return effect_data
+
+
+def _parse_bonus_entry(entry) -> Dict:
+    """Extract every bonus shape we know how to format from one bonus Entry."""
+    data: Dict = {"yields": {}, "units": {}, "courtiers": [], "resources": {},
+                  "borderGrowth": 0, "happinessLevels": 0, "all": []}
+    fields = _child_map(entry)
+    gy = fields.get("aiGlobalYields")
+    if gy is not None:
+        for pair in gy.findall("Pair"):
+            k, v = pair.find("zIndex"), pair.find("iValue")
+            if k is not None and v is not None and k.text and v.text:
+                data["yields"][k.text.replace("YIELD_", "").lower()] = int(v.text)
+    au = fields.get("aiUnits")
+    if au is not None:
+        for pair in au.findall("Pair"):
+            k, v = pair.find("zIndex"), pair.find("iValue")
+            if k is not None and v is not None and k.text and v.text:
+                data["units"][k.text] = int(v.text)
+    ac = fields.get("AddCourtierOther")
+    if ac is not None:
+        for pair in ac.findall("Pair"):
+            first = pair.find("First")
+            if first is not None and first.text:
+                data["courtiers"].append(first.text)
+    ir = fields.get("aeImportResources")
+    if ir is not None:
+        for pair in ir.findall("Pair"):
+            k, v = pair.find("zIndex"), pair.find("iValue")
+            if k is not None and v is not None and k.text and v.text:
+                data["resources"][k.text] = int(v.text)
+    bg = fields.get("iBorderGrowth")
+    if bg is not None and bg.text:
+        data["borderGrowth"] = int(bg.text)
+    hl = fields.get("iHappinessLevels")
+    if hl is not None and hl.text:
+        data["happinessLevels"] = int(hl.text)
+    # Indirect city-bonus reference — followed and merged by parse_bonuses.
+    city = fields.get("aeAllCityBonuses")
+    if city is not None:
+        for z in city.findall("zValue"):
+            if z.text:
+                data["all"].append(z.text)
+    return data
+
+
+def _load_bonus_entries(file_path: Path) -> Dict[str, Dict]:
+    """Read bonus.xml / bonus-event-*.xml into {BONUS_*: raw extraction}.
+    A malformed file yields whatever parsed before the error."""
+    entries = {}
+    try:
+        for bonus in _iter_entries(file_path):
+            bonus_type = bonus.findtext("zType")
+            if not bonus_type:
+                continue
+            entries[bonus_type] = _parse_bonus_entry(bonus)
+    except ET.ParseError:
+        pass
+    return entries
+
+
+def _load_tech_prereqs(file_path: Path, prefix: str) -> Dict[str, List[str]]:
+    """Read unit.xml / project.xml into {TECH_*: [names it unlocks]}.
+
+    Both files list one thing per Entry with a single TechPrereq, so one
+    streaming pass serves either; prefix is the constant prefix to strip.
+    """
+    tech_items = defaultdict(list)
+    for entry in _iter_entries(file_path):
+        item_type = entry.findtext("zType")
+        tech_prereq = entry.findtext("TechPrereq")
+        if item_type and tech_prereq:
+            tech_items[tech_prereq].append(_format_name(item_type, prefix))
+    return dict(tech_items)
+
+
+def _intern_all(items: List[str]) -> List[str]:
+    """Intern every string in a loader's result list.
+
+    Loaders may run in a worker process or come back from the pickle cache,
+    and unpickled strings are fresh objects, so interning happens here in
+    the parent as results are merged.
+    """
+    intern = sys.intern
+    return [intern(item) for item in items]
+
+
+# Files smaller than this are parsed inline; a worker process isn't worth it.
+PARALLEL_MIN_BYTES = 100 * 1024
+
+# Improvements don't have direct tech prereqs in the XML, and laws are
+# unlocked by law classes, so both are mapped by hand from the original data.
+_MANUAL_IMPROVEMENT_UNLOCKS = MappingProxyType({
+    "TECH_STONECUTTING": ("Fort", "Quarry"),
+    "TECH_TRAPPING": ("Camp",),
+    "TECH_DIVINATION": ("Shrine",),
+    "TECH_ADMINISTRATION": ("Granary",),
+    "TECH_HUSBANDRY": ("Pasture",),
+    "TECH_DRAMA": ("Odeon",),
+    "TECH_POLIS": ("Hamlet",),
+    "TECH_MILITARY_DRILL": ("Barracks",),
+    "TECH_ARISTOCRACY": ("Kushite Pyramids",),
+    "TECH_FORESTRY": ("Lumbermill",),
+    "TECH_COINAGE": ("Market",),
+    "TECH_CITIZENSHIP": ("Courthouse",),
+    "TECH_ARCHITECTURE": ("Baths",),
+    "TECH_LAND_CONSOLIDATION": ("Grove",),
+    "TECH_COMPOSITE_BOW": ("Range",),
+    "TECH_MONASTICISM": ("Monastery",),
+    "TECH_SCHOLARSHIP": ("Library",),
+    "TECH_VAULTING": ("Cathedral",),
+    "TECH_DOCTRINE": ("Temple",),
+    "TECH_HYDRAULICS": ("Watermill",),
+    "TECH_WINDLASS": ("Windmill",),
+    "TECH_CARTOGRAPHY": ("Harbor",),
+})
+
+_MANUAL_LAW_UNLOCKS = MappingProxyType({
+    "TECH_LABOR_FORCE": ("Slavery/Freedom",),
+    "TECH_ARISTOCRACY": ("Centralization/Vassalage",),
+    "TECH_RHETORIC": ("Epics/Exploration",),
+    "TECH_NAVIGATION": ("Colonies/Serfdom",),
+    "TECH_SOVEREIGNTY": ("Tyranny/Constitution",),
+    "TECH_CITIZENSHIP": ("Divine Rule/Legal Code",),
+    "TECH_ARCHITECTURE": ("Philosophy/Engineering",),
+    "TECH_MONASTICISM": ("Monotheism/Polytheism",),
+    "TECH_VAULTING": ("Iconography/Calligraphy",),
+    "TECH_MANOR": ("Professional Army/Volunteers",),
+    "TECH_DOCTRINE": ("Tolerance/Orthodoxy",),
+    "TECH_LATEEN_SAIL": ("Autarky/Trade League",),
+    "TECH_JURISPRUDENCE": ("Guilds/Elites",),
+    "TECH_MARTIAL_CODE": ("Pilgrimage/Holy War",),
+    "TECH_FISCAL_POLICY": ("Coin Debasement/Monetary Reform",),
+})
+
+# (game file the table stands in for, unlocks kind, table)
+_MANUAL_UNLOCK_TABLES = (
+    ("improvement.xml", "improvements", _MANUAL_IMPROVEMENT_UNLOCKS),
+    ("law.xml", "laws", _MANUAL_LAW_UNLOCKS),
+)
+
+
+def _merge_unlock_tables(tables) -> MappingProxyType:
+    """Fold per-kind {tech_id: items} tables into {tech_id: {kind: items}}."""
+    merged: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+    for _, kind, table in tables:
+        for tech_id, items in table.items():
+            merged.setdefault(tech_id, {})[kind] = items
+    return MappingProxyType(merged)
+
+
+# Every hand-kept unlock, keyed once by tech id.
+_MANUAL_UNLOCKS = _merge_unlock_tables(_MANUAL_UNLOCK_TABLES)
+
+# Marker for a loader result that isn't in the on-disk cache.
+_CACHE_MISS = object()
+
+
 class OldWorldParser:
     """Parser for Old World XML game files"""
     
-    def __init__(self, xml_dir: str = "XML/Infos"):
+    def __init__(self, xml_dir: str = "XML/Infos", cache_dir: Optional[str] = None):
         self.xml_dir = Path(xml_dir)
+        # Optional on-disk cache of loader results; see _cache_path().
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.techs = []
         self.bonus_techs = []
         self.nations = {}
         self.nation_colors = {}
         self.text_data = {}
         self.effect_player_data = {}
-        
-    def parse_all(self):
-        """Parse all required XML files"""
+        self.bonus_values = {}
+        self._unlocks_by_id = {}
+        # os.stat() results for game files, so each file is stat'ed once per run.
+        self._stats: Dict[str, Optional[os.stat_result]] = {}
+        self._bonus_paths: Optional[List[Path]] = None
+        # Loader results computed ahead of time by prefetch(), keyed like _load().
+        self._prefetched = {}
+
+    def parse_all(self, prefetch: bool = True):
+        """Parse all required XML files.
+
+        Pass prefetch=False when prefetch() has already been called.
+        """
         print("Parsing Old World XML files...")
+
+        # Read the large independent files in parallel up front
+        if prefetch:
+            self.prefetch()
         
         # Parse text files first to get names and descriptions
-        self.parse_text_infos()
-        self.parse_text_nation()
-        self.parse_text_bonus()
-        self.parse_text_eoti()
+        self.parse_text_files()
         
         # Parse effect player data for unlocks
         self.parse_effect_player()
         
-        # Parse main data files
+        # Parse main data files. Bonuses come before techs: bonus cards
+        # are built while reading tech.xml and need their effect values.
+        self.parse_bonuses()
         self.parse_techs()
         self.parse_nations()
         self.parse_nation_colors()
-        self.parse_bonuses()
         
         # Parse what techs unlock
         self.parse_unit_unlocks()
-        self.parse_improvement_unlocks()
-        self.parse_law_unlocks()
+        self.apply_manual_unlocks()
         self.parse_project_unlocks()
         
-        # Post-process to separate bonus techs
-        self.identify_bonus_techs()
-        
         print(f"Parsed {len(self.techs)} main technologies")
         print(f"Parsed {len(self.bonus_techs)} bonus technologies")
         print(f"Parsed {len(self.nations)} nations")
         
+    def _loader_jobs(self) -> List[Tuple]:
+        """(loader, path, *args) for every file that can be read independently."""
+        jobs = [(_load_text_file, self.xml_dir / f) for f in self.TEXT_FILES]
+        jobs.append((_load_effect_player, self.xml_dir / "effectPlayer.xml"))
+        jobs += [(_load_bonus_entries, f) for f in self._bonus_files()]
+        jobs.append((_load_tech_prereqs, self.xml_dir / "unit.xml", "UNIT_"))
+        jobs.append((_load_tech_prereqs, self.xml_dir / "project.xml", "PROJECT_"))
+        return jobs
+
+    def prefetch(self):
+        """Run the independent loaders for large files in worker processes.
+
+        Only files of at least PARALLEL_MIN_BYTES are farmed out, and only on
+        multi-core machines; everything else is read inline when its parse_*
+        method asks for it. Where a process pool can't be started (no
+        semaphores or fork in some sandboxes), lxml falls back to threads,
+        since libxml2 parses without holding the GIL. If a worker fails the
+        file is simply read inline later, so errors surface exactly where
+        they would serially.
+        """
+        jobs = [(loader, path, *args) for loader, path, *args in self._loader_jobs()
+                if self._exists(path) and self._stat(path).st_size >= PARALLEL_MIN_BYTES
+                and not self._is_cached(loader, path, args)]
+        if len(jobs) < 2 or (os.cpu_count() or 1) < 2:
+            return
+        # Under fork every worker is started up front, so don't start more
+        # than there are jobs.
+        workers = min(len(jobs), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                self._collect(pool, jobs)
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            if not HAVE_LXML:
+                return
+            # The stdlib parser holds the GIL, so threads only help with lxml.
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                self._collect(pool, jobs)
+
+    def _collect(self, pool, jobs: List[Tuple]):
+        """Run jobs not yet prefetched on pool and keep the ones that succeed."""
+        futures = {}
+        for loader, path, *args in jobs:
+            key = self._load_key(loader, path, args)
+            if key not in self._prefetched:
+                futures[key] = pool.submit(loader, path, *args)
+        for key, future in futures.items():
+            try:
+                self._prefetched[key] = future.result()
+            except Exception:
+                pass
+
+    def _stat(self, file_path: Path) -> Optional[os.stat_result]:
+        """os.stat() of a game file (None if missing), remembered for the run."""
+        key = str(file_path)
+        if key not in self._stats:
+            try:
+                self._stats[key] = file_path.stat()
+            except OSError:
+                self._stats[key] = None
+        return self._stats[key]
+
+    def _exists(self, file_path: Path) -> bool:
+        return self._stat(file_path) is not None
+
+    @staticmethod
+    def _load_key(loader, file_path: Path, args) -> Tuple:
+        return (loader.__name__, str(file_path), *args)
+
+    def _load(self, loader, file_path: Path, *args):
+        """Return loader(file_path, *args), reusing a cached or prefetched result if any."""
+        result = self._read_cache(loader, file_path, args)
+        if result is not _CACHE_MISS:
+            return result
+        key = self._load_key(loader, file_path, args)
+        if key in self._prefetched:
+            result = self._prefetched.pop(key)
+        else:
+            result = loader(file_path, *args)
+        self._write_cache(loader, file_path, args, result)
+        return result
+
+    def _cache_path(self, loader, file_path: Path, args) -> Optional[Path]:
+        """Cache file for one loader result, or None when caching is off.
+
+        The name hashes the source file's mtime and size together with this
+        script's own mtime. Editing either the XML or the loaders therefore
+        points at a new file rather than returning a stale result.
+        """
+        if self.cache_dir is None:
+            return None
+        st = self._stat(file_path)
+        if st is None:
+            return None
+        try:
+            script_mtime = Path(__file__).stat().st_mtime_ns
+        except OSError:
+            return None
+        stamp = repr((self._load_key(loader, file_path, args), st.st_mtime_ns,
+                      st.st_size, script_mtime))
+        digest = hashlib.sha256(stamp.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{loader.__name__}-{file_path.name}-{digest}.pkl"
+
+    def _is_cached(self, loader, file_path: Path, args) -> bool:
+        path = self._cache_path(loader, file_path, args)
+        return path is not None and path.exists()
+
+    def _read_cache(self, loader, file_path: Path, args):
+        path = self._cache_path(loader, file_path, args)
+        if path is None:
+            return _CACHE_MISS
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return _CACHE_MISS
+
+    def _write_cache(self, loader, file_path: Path, args, result):
+        """Store a loader result, replacing older entries for the same file."""
+        path = self._cache_path(loader, file_path, args)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in path.parent.glob(f"{loader.__name__}-{file_path.name}-*.pkl"):
+                stale.unlink()
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+        except OSError as e:
+            print(f"Warning: could not write cache {path}: {e}")
+
     TEXT_FILES = [
         "text-infos.xml",
         "text-nation.xml",
@@ -97,141 +581,32 @@ class OldWorldParser:
         "text-unit-hittite.xml",
     ]
 
-    def _load_text_file(self, filename: str) -> int:
-        """Load any text-*.xml file. Real schema is <zType>…</zType><en-US>…</en-US>."""
-        file_path = self.xml_dir / filename
-        if not file_path.exists():
-            return 0
-        try:
-            root = ET.parse(file_path).getroot()
-        except ET.ParseError:
-            return 0
-        loaded = 0
-        for entry in root.findall(".//Entry"):
-            key_node = entry.find("zType")
-            text_node = entry.find("en-US")
-            if key_node is None or text_node is None:
-                continue
-            if not key_node.text or not text_node.text:
-                continue
-            self.text_data[key_node.text] = self.clean_text(text_node.text)
-            loaded += 1
-        return loaded
-
-    def parse_text_infos(self):
+    def parse_text_files(self):
+        """Load every localization file in TEXT_FILES into text_data."""
         for f in self.TEXT_FILES:
-            self._load_text_file(f)
-
-    def parse_text_nation(self):
-        # Folded into parse_text_infos via TEXT_FILES — kept as a no-op for
-        # backwards-compat with the parse_all() call list.
-        return
-
-    def parse_text_bonus(self):
-        return
-
-    def parse_text_eoti(self):
-        # text-eoti.xml is part of TEXT_FILES; the legacy hand-rolled loader
-        # below is kept for compatibility with older versions of the game that
-        # used a slightly different schema (zType + the *first* localized
-        # child). Most modern installs hit the standard loader first.
-        file_path = self.xml_dir / "text-eoti.xml"
-        if not file_path.exists():
-            return
-
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-
-        for entry in root.findall(".//Entry"):
-            tag = entry.find("zType")
-            text = entry.find("en-US")
-            if tag is not None and text is not None and tag.text and text.text:
-                self.text_data[tag.text] = self.clean_text(text.text)
+            file_path = self.xml_dir / f
+            if self._exists(file_path):
+                self.text_data.update(self._load(_load_text_file, file_path))
 
     def parse_effect_player(self):
         """Parse effectPlayer.xml for tech unlocks"""
         file_path = self.xml_dir / "effectPlayer.xml"
-        if not file_path.exists():
+        if not self._exists(file_path):
             print(f"Warning: {file_path} not found")
             return
-            
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        for entry in root.findall(".//Entry"):
-            effect_type = entry.find("zType")
-            if effect_type is None or not effect_type.text:
-                continue
-                
-            unlocks = {
-                "units": [],
-                "improvements": [],
-                "laws": [],
-                "projects": [],
-                "specialists": [],
-                "other": []
-            }
-            
-            # Extract various unlock types
-            for unit in entry.findall(".//aeUnitUnlock/zValue"):
-                if unit.text:
-                    unlocks["units"].append(self.format_name(unit.text, "UNIT_"))
-            
-            for imp in entry.findall(".//aeImprovementUnlock/zValue"):
-                if imp.text:
-                    unlocks["improvements"].append(self.format_name(imp.text, "IMPROVEMENT_"))
-            
-            for law in entry.findall(".//aeLawUnlock/zValue"):
-                if law.text:
-                    unlocks["laws"].append(self.format_name(law.text, "LAW_"))
-            
-            for proj in entry.findall(".//aeProjectUnlock/zValue"):
-                if proj.text:
-                    unlocks["projects"].append(self.format_name(proj.text, "PROJECT_"))
-            
-            for spec in entry.findall(".//aeSpecialistUnlock/zValue"):
-                if spec.text:
-                    unlocks["specialists"].append(self.format_name(spec.text, "SPECIALIST_"))
-            
-            self.effect_player_data[effect_type.text] = unlocks
-    
+
+        intern = sys.intern
+        for effect_id, unlocks in self._load(_load_effect_player, file_path).items():
+            self.effect_player_data[intern(effect_id)] = {
+                kind: _intern_all(names) for kind, names in unlocks.items()}
+
     def format_name(self, text: str, prefix: str) -> str:
         """Format a game constant name for display"""
-        if text.startswith(prefix):
-            text = text[len(prefix):]
-        # Convert underscore to spaces and title case
-        result = text.replace("_", " ").title()
-        
-        # Remove upgrade numbers from project names
-        if prefix == "PROJECT_":
-            # Remove " 1", " 2", etc. from the end
-            import re
-            result = re.sub(r'\s+\d+$', '', result)
-        
-        return result
+        return _format_name(text, prefix)
     
     def clean_text(self, text: str) -> str:
-        """Store a game-text value in a lightly normalized form.
-
-        Old World's localization strings encode grammatical forms with `~`
-        separators (e.g. "Stone~icon(YIELD_STONE)Stone") plus templating
-        macros: `link(TYPE)` / `link(TYPE,N)` / `icon(TYPE)` and curly
-        substitution like `{TEXT_X}`.
-
-        We keep only the first grammatical form here. We do NOT yet resolve
-        `link()` references because the target text may not be loaded yet —
-        callers go through `pretty_text()` to get a fully resolved label.
-        """
-        if not text:
-            return ""
-
-        text = text.split("~", 1)[0]
-        # Strip HTML-ish formatting tags but leave link()/icon() macros for
-        # pretty_text() to resolve.
-        text = re.sub(r'</?[^>]+>', '', text)
-        text = re.sub(r'\{[^}]+\}', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        """Store a game-text value in a lightly normalized form (see _clean_text)."""
+        return _clean_text(text)
 
     def pretty_text(self, value: str, _depth: int = 0) -> str:
         """Resolve a stored text value or a TEXT_* key into a final display
@@ -246,7 +621,7 @@ class OldWorldParser:
         # Bound the recursion so a broken loop in localization data can't
         # infinite-loop the parser.
         if _depth > 5:
-            return re.sub(r'\b(?:link|icon)\([^)]*\)', '', value).strip()
+            return _MACRO_RE.sub('', value).strip()
 
         def link_sub(m):
             target = m.group(1).split(",")[0].strip()
@@ -261,63 +636,91 @@ class OldWorldParser:
             slug = slug.replace("RESOURCE_", "").replace("TECH_", "")
             return slug.replace("_", " ").title()
 
-        value = re.sub(r'\blink\(([^)]*)\)', link_sub, value)
-        value = re.sub(r'\bicon\([^)]*\)', '', value)
-        return re.sub(r'\s+', ' ', value).strip()
+        value = _LINK_RE.sub(link_sub, value)
+        value = _ICON_RE.sub('', value)
+        return _WHITESPACE_RE.sub(' ', value).strip()
     
     def parse_techs(self):
         """Parse tech.xml for technology data"""
         file_path = self.xml_dir / "tech.xml"
-        if not file_path.exists():
+        if not self._exists(file_path):
             print(f"Error: {file_path} not found")
             return
-            
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        for tech in root.findall(".//Entry"):
-            tech_data = self.parse_tech_node(tech)
-            if tech_data:
-                self.techs.append(tech_data)
+
+        # parse_tech_node classifies each entry, so it lands directly in
+        # the right list with the right shape. Bonus cards format their
+        # effect from self.bonus_values, so parse_bonuses() must run first.
+        parse_node = self.parse_tech_node
+        add_to = {"main": self.techs.append, "bonus": self.bonus_techs.append}
+        for tech in _iter_entries(file_path):
+            parsed = parse_node(tech)
+            if parsed:
+                kind, tech_data = parsed
+                add_to[kind](tech_data)
+        self._rebuild_tech_index()
+
+    def _rebuild_tech_index(self):
+        """Refresh the id -> unlocks lookup after self.techs is replaced."""
+        self._unlocks_by_id = {t["id"]: t["unlocks"] for t in self.techs}
+
+    def _assign_unlocks(self, kind: str, tech_items: Dict[str, List[str]]):
+        """Set tech["unlocks"][kind] for every known tech id in tech_items."""
+        unlocks_by_id = self._unlocks_by_id
+        for tech_id, items in tech_items.items():
+            unlocks = unlocks_by_id.get(tech_id)
+            if unlocks is not None:
+                unlocks[kind] = _intern_all(items)
     
-    def parse_tech_node(self, tech_node) -> Optional[Dict]:
-        """Parse a single tech XML node"""
-        tech_type = tech_node.find("zType")
+    def parse_tech_node(self, tech_node) -> Optional[Tuple[str, Dict]]:
+        """Parse a single tech XML node into ("main" | "bonus", data).
+
+        Returns None for disabled techs, the template entry, and hidden
+        event bonuses, none of which are shown.
+        """
+        # One pass over the children; every field below is a dict lookup
+        # instead of its own linear find().
+        fields = _child_map(tech_node)
+        tech_type = fields.get("zType")
         if tech_type is None or not tech_type.text:
             return None
             
-        tech_id = tech_type.text
+        tech_id = sys.intern(tech_type.text)
         
         # Skip the template entry
         if not tech_id:
             return None
         
         # Get basic info
-        cost = self.get_int_value(tech_node, "iCost", 0)
+        cost = self.get_int_value(fields, "iCost", 0)
         
         # Get position for tech tree layout
-        row = self.get_int_value(tech_node, "iRow", 0)
-        column = self.get_int_value(tech_node, "iColumn", 0)
+        row = self.get_int_value(fields, "iRow", 0)
+        column = self.get_int_value(fields, "iColumn", 0)
         
         # Get prerequisites from abTechPrereq
         prereqs = []
-        prereq_node = tech_node.find("abTechPrereq")
+        prereq_node = fields.get("abTechPrereq")
         if prereq_node is not None:
             for pair in prereq_node.findall("Pair"):
                 index = pair.find("zIndex")
                 value = pair.find("bValue")
                 if index is not None and index.text and value is not None and value.text == "1":
-                    prereqs.append(index.text)
+                    prereqs.append(sys.intern(index.text))
         
-        # Get unlocks from EffectPlayer
-        unlocks = {"units": [], "improvements": [], "laws": [], "projects": [], "specialists": [], "other": []}
-        effect_player = tech_node.find("EffectPlayer")
+        # Get unlocks from EffectPlayer. Each tech gets its own dict (the
+        # parse_*_unlocks merges assign into it), while kinds the effect
+        # doesn't grant share one immutable empty tuple.
+        effect = None
+        effect_player = fields.get("EffectPlayer")
         if effect_player is not None and effect_player.text:
-            if effect_player.text in self.effect_player_data:
-                unlocks = self.effect_player_data[effect_player.text]
+            effect = self.effect_player_data.get(effect_player.text)
+        if effect:
+            unlocks = {kind: effect.get(kind, ()) for kind in UNLOCK_KINDS}
+        else:
+            unlocks = dict.fromkeys(UNLOCK_KINDS, ())
         
         # Get name and description from text data
-        name_tag = tech_node.find("Name")
+        name_tag = fields.get("Name")
         if name_tag is not None and name_tag.text:
             name = self.pretty_text(name_tag.text) or tech_id.replace("TECH_", "").replace("_", " ").title()
         else:
@@ -325,31 +728,31 @@ class OldWorldParser:
 
         # Get description
         desc = ""
-        advice_tag = tech_node.find("Advice")
+        advice_tag = fields.get("Advice")
         if advice_tag is not None and advice_tag.text:
             desc = self.pretty_text(advice_tag.text)
         
         # Check if disabled (skip entirely)
-        is_disabled = self.get_bool_value(tech_node, "bDisable")
+        is_disabled = self.get_bool_value(fields, "bDisable")
         if is_disabled:
             return None
 
         # Check if it's a bonus tech
         is_bonus = (
-            self.get_bool_value(tech_node, "bHide") or
-            self.get_bool_value(tech_node, "bTrash") or
-            self.get_bool_value(tech_node, "bNoFree")
+            self.get_bool_value(fields, "bHide") or
+            self.get_bool_value(fields, "bTrash") or
+            self.get_bool_value(fields, "bNoFree")
         )
         
         # Get bonus discover value
         bonus_discover = None
-        bonus_node = tech_node.find("BonusDiscover")
+        bonus_node = fields.get("BonusDiscover")
         if bonus_node is not None and bonus_node.text:
             bonus_discover = bonus_node.text
         
         # Get nation restrictions for bonus techs
         nation_valid = []
-        nation_node = tech_node.find("aeNationValid")
+        nation_node = fields.get("aeNationValid")
         if nation_node is not None:
             for nation in nation_node.findall("zValue"):
                 if nation.text:
@@ -357,17 +760,27 @@ class OldWorldParser:
 
         # Get culture requirement (replaces tech prereqs for nation bonus techs)
         culture_valid = None
-        culture_node = tech_node.find("CultureValid")
+        culture_node = fields.get("CultureValid")
         if culture_node is not None and culture_node.text:
             culture_valid = culture_node.text
 
         # Sprite name in resources.assets (used to pull bonus-card icons).
         icon_name = None
-        icon_node = tech_node.find("zIconName")
+        icon_node = fields.get("zIconName")
         if icon_node is not None and icon_node.text:
             icon_name = icon_node.text
 
-        return {
+        # Victory techs are main techs even though the game hides them.
+        # Event bonuses aren't researchable, so they get no card.
+        # Note: RESOURCE bonuses (luxuries) are kept as they're researchable.
+        if is_bonus and not _VICTORY_TECH_RE.search(tech_id):
+            if "EVENT_" in tech_id:
+                return None
+            return "bonus", self.make_bonus_tech(
+                tech_id, name, desc, cost, prereqs, bonus_discover,
+                nation_valid, culture_valid, icon_name)
+
+        return "main", {
             "id": tech_id,
             "name": name,
             "description": desc,
@@ -376,25 +789,60 @@ class OldWorldParser:
             "column": column,
             "prereqs": prereqs,
             "unlocks": unlocks,
-            "isBonus": is_bonus,
-            "bonusDiscover": bonus_discover,
-            "nationValid": nation_valid,
             "cultureValid": culture_valid,
             "iconName": icon_name,
         }
+
+    def make_bonus_tech(self, tech_id: str, name: str, desc: str, cost: int,
+                        prereqs: List[str], bonus_discover: Optional[str],
+                        nation_valid: List[str], culture_valid: Optional[str],
+                        icon_name: Optional[str]) -> Dict:
+        """Shape a hidden tech as a bonus card for the frontend"""
+        # Parent tech comes from the prerequisites
+        parent = prereqs[0] if prereqs else None
+
+        # Name comes straight from text-infos.xml; effect comes straight
+        # from bonus.xml via the generic format_bonus_effect helper.
+        bonus_text = ""
+        if bonus_discover:
+            bonus_text = self.format_bonus_effect(bonus_discover)
+        if not bonus_text:
+            bonus_text = desc or name
+
+        bonus_tech = {
+            "id": tech_id,
+            "name": name,
+            "cost": cost,
+            "parent": parent,
+            "bonus": bonus_text,
+        }
+
+        # Add nation field if nation-specific
+        if nation_valid:
+            bonus_tech["nation"] = nation_valid[0]
+
+        # Add culture requirement if present
+        if culture_valid:
+            bonus_tech["cultureRequired"] = culture_valid
+
+        # Icon slug for img/icons/bonus/<slug>.png (sourced via extract_bonus_icons.py)
+        if icon_name:
+            bonus_tech["iconName"] = icon_name
+
+        return bonus_tech
     
     def parse_nations(self):
         """Parse nation.xml for nation data and starting techs"""
         file_path = self.xml_dir / "nation.xml"
-        if not file_path.exists():
+        if not self._exists(file_path):
             print(f"Warning: {file_path} not found")
             return
-            
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        for nation in root.findall(".//Entry"):
-            nation_type = nation.find("zType")
+
+        text_data = self.text_data
+        nations = self.nations
+        for nation in _iter_entries(file_path):
+            fields = _child_map(nation)
+            nation_type = fields.get("zType")
             if nation_type is None or not nation_type.text:
                 continue
                 
@@ -402,21 +850,21 @@ class OldWorldParser:
             
             # Get starting techs
             starting_techs = []
-            starting_node = nation.find("aeStartingTech")
+            starting_node = fields.get("aeStartingTech")
             if starting_node is not None:
                 for tech in starting_node.findall("zValue"):
                     if tech.text:
                         starting_techs.append(tech.text)
             
             # Get nation name from text data
-            name_tag = nation.find("Name")
+            name_tag = fields.get("Name")
             if name_tag is not None and name_tag.text:
-                nation_name = self.text_data.get(name_tag.text, nation_id.replace("NATION_", "").title())
+                nation_name = text_data.get(name_tag.text, nation_id.replace("NATION_", "").title())
             else:
                 nation_name = nation_id.replace("NATION_", "").title()
             
             if starting_techs:  # Only add nations that have starting techs
-                self.nations[nation_id] = {
+                nations[nation_id] = {
                     "id": nation_id,
                     "name": nation_name,
                     "startingTechs": starting_techs
@@ -453,7 +901,7 @@ class OldWorldParser:
         """
         raw = {}
         file_path = self.xml_dir / "color.xml"
-        if not file_path.exists():
+        if not self._exists(file_path):
             print(f"Warning: {file_path} not found — falling back to built-in nation colors")
 
         def norm(hex_value):
@@ -467,8 +915,8 @@ class OldWorldParser:
                 h = h[:7]
             return h if len(h) == 7 else None
 
-        if file_path.exists():
-            for entry in ET.parse(file_path).getroot().findall(".//Entry"):
+        if self._exists(file_path):
+            for entry in _iter_entries(file_path):
                 ztype = entry.findtext("zType") or ""
                 if ztype.startswith("COLOR_NATION_"):
                     raw[ztype] = norm(entry.findtext("zHexValue"))
@@ -488,77 +936,35 @@ class OldWorldParser:
                 "crest": suffix.lower(),
             }
 
+    def _bonus_files(self) -> List[Path]:
+        if self._bonus_paths is None:
+            self._bonus_paths = ([self.xml_dir / "bonus.xml"]
+                                 + sorted(self.xml_dir.glob("bonus-event*.xml")))
+        return self._bonus_paths
+
     def parse_bonuses(self):
         """Parse bonus.xml plus DLC bonus-event-*.xml for bonus tech values."""
-        candidates = [self.xml_dir / "bonus.xml"]
-        candidates += sorted(self.xml_dir.glob("bonus-event*.xml"))
+        candidates = self._bonus_files()
 
         # Lookup keyed by BONUS_* id. Each value captures every shape we know how
         # to format into a human effect string.
         self.bonus_values: Dict[str, Dict] = {}
-        raw_entries: Dict[str, ET.Element] = {}
+
+        # References are resolved against the raw per-entry extractions.
+        raw_entries: Dict[str, Dict] = {}
         for file_path in candidates:
-            if not file_path.exists():
-                continue
-            try:
-                root = ET.parse(file_path).getroot()
-            except ET.ParseError:
-                continue
-            for bonus in root.findall(".//Entry"):
-                bonus_type = bonus.find("zType")
-                if bonus_type is None or not bonus_type.text:
-                    continue
-                raw_entries[bonus_type.text] = bonus
-
-        def parse_entry(entry: ET.Element) -> Dict:
-            data: Dict = {"yields": {}, "units": {}, "courtiers": [], "resources": {},
-                          "borderGrowth": 0, "happinessLevels": 0, "all": []}
-            gy = entry.find("aiGlobalYields")
-            if gy is not None:
-                for pair in gy.findall("Pair"):
-                    k, v = pair.find("zIndex"), pair.find("iValue")
-                    if k is not None and v is not None and k.text and v.text:
-                        data["yields"][k.text.replace("YIELD_", "").lower()] = int(v.text)
-            au = entry.find("aiUnits")
-            if au is not None:
-                for pair in au.findall("Pair"):
-                    k, v = pair.find("zIndex"), pair.find("iValue")
-                    if k is not None and v is not None and k.text and v.text:
-                        data["units"][k.text] = int(v.text)
-            ac = entry.find("AddCourtierOther")
-            if ac is not None:
-                for pair in ac.findall("Pair"):
-                    first = pair.find("First")
-                    if first is not None and first.text:
-                        data["courtiers"].append(first.text)
-            ir = entry.find("aeImportResources")
-            if ir is not None:
-                for pair in ir.findall("Pair"):
-                    k, v = pair.find("zIndex"), pair.find("iValue")
-                    if k is not None and v is not None and k.text and v.text:
-                        data["resources"][k.text] = int(v.text)
-            bg = entry.findtext("iBorderGrowth")
-            if bg:
-                data["borderGrowth"] = int(bg)
-            hl = entry.findtext("iHappinessLevels")
-            if hl:
-                data["happinessLevels"] = int(hl)
-            # Indirect city-bonus reference — follow and merge.
-            city = entry.find("aeAllCityBonuses")
-            if city is not None:
-                for z in city.findall("zValue"):
-                    if z.text:
-                        data["all"].append(z.text)
-            return data
-
-        for bid, entry in raw_entries.items():
-            data = parse_entry(entry)
+            if self._exists(file_path):
+                raw_entries.update(self._load(_load_bonus_entries, file_path))
+
+        for bid, raw in raw_entries.items():
+            # Copy so merging references never touches the shared raw extraction.
+            data = {k: v.copy() if isinstance(v, (dict, list)) else v for k, v in raw.items()}
+            data["yields"] = {sys.intern(k): n for k, n in raw["yields"].items()}
             # Resolve aeAllCityBonuses references one level deep.
             for ref in data["all"]:
-                ref_entry = raw_entries.get(ref)
-                if ref_entry is None:
+                sub = raw_entries.get(ref)
+                if sub is None:
                     continue
-                sub = parse_entry(ref_entry)
                 for k in ("yields", "units", "resources"):
                     data[k].update(sub[k])
                 data["courtiers"].extend(sub["courtiers"])
@@ -602,275 +1008,73 @@ class OldWorldParser:
 
         return ", ".join(parts)
     
-    def identify_bonus_techs(self):
-        """Separate bonus techs from main techs"""
-        main_techs = []
-        bonus_techs = []
-        
-        # Victory techs and event bonuses to exclude from bonus cards
-        # Note: RESOURCE bonuses (luxuries) should be included as they're researchable
-        exclude_from_bonus = ["ECONOMIC_REFORM", "MILITARY_PRESTIGE", "INDUSTRIAL_PROGRESS", 
-                             "EVENT_"]
-        
-        for tech in self.techs:
-            # Check if this should be excluded
-            should_exclude = any(exc in tech["id"] for exc in exclude_from_bonus)
-            
-            if tech.get("isBonus") and not should_exclude:
-                # Format bonus tech for the frontend
-                # Get parent tech from prerequisites
-                parent = tech["prereqs"][0] if tech.get("prereqs") else None
-                
-                # Name comes straight from text-infos.xml; effect comes
-                # straight from bonus.xml. The big hardcoded if-elif chains
-                # this used to carry have been removed in favor of the
-                # generic format_bonus_effect helper.
-                bonus_name = tech.get("name") or tech["id"].replace("TECH_", "").replace("_", " ").title()
-                bonus_text = ""
-                if tech.get("bonusDiscover"):
-                    bonus_text = self.format_bonus_effect(tech["bonusDiscover"])
-                if not bonus_text:
-                    bonus_text = tech.get("description", "") or bonus_name
-
-                
-                bonus_tech = {
-                    "id": tech["id"],
-                    "name": bonus_name,
-                    "cost": tech["cost"],
-                    "parent": parent,
-                    "bonus": bonus_text,
-                }
-
-                # Add nation field if nation-specific
-                if tech.get("nationValid"):
-                    bonus_tech["nation"] = tech["nationValid"][0]
-
-                # Add culture requirement if present
-                if tech.get("cultureValid"):
-                    bonus_tech["cultureRequired"] = tech["cultureValid"]
-
-                # Icon slug for img/icons/bonus/<slug>.png (sourced via extract_bonus_icons.py)
-                if tech.get("iconName"):
-                    bonus_tech["iconName"] = tech["iconName"]
-
-                bonus_techs.append(bonus_tech)
-            elif should_exclude and any(vic in tech["id"] for vic in ["ECONOMIC_REFORM", "MILITARY_PRESTIGE", "INDUSTRIAL_PROGRESS"]):
-                # Victory techs should be main techs, not bonus cards
-                tech.pop("isBonus", None)
-                tech.pop("nationValid", None)
-                tech.pop("bonusValue", None)
-                tech.pop("bonusDiscover", None)
-                main_techs.append(tech)
-            elif not tech.get("isBonus"):
-                # Regular main tech
-                tech.pop("isBonus", None)
-                tech.pop("nationValid", None)
-                tech.pop("bonusValue", None)
-                tech.pop("bonusDiscover", None)
-                main_techs.append(tech)
-        
-        self.techs = main_techs
-        self.bonus_techs = bonus_techs
-    
     def parse_unit_unlocks(self):
         """Parse unit.xml to find what units each tech unlocks"""
         file_path = self.xml_dir / "unit.xml"
-        if not file_path.exists():
+        if not self._exists(file_path):
             print(f"Warning: {file_path} not found")
             return
             
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        # Build a mapping of tech -> units
-        tech_units = {}
-        for unit in root.findall(".//Entry"):
-            unit_type = unit.find("zType")
-            tech_prereq = unit.find("TechPrereq")
-            if unit_type is not None and unit_type.text and tech_prereq is not None and tech_prereq.text:
-                tech_id = tech_prereq.text
-                unit_name = self.format_name(unit_type.text, "UNIT_")
-                if tech_id not in tech_units:
-                    tech_units[tech_id] = []
-                tech_units[tech_id].append(unit_name)
-        
+        tech_units = self._load(_load_tech_prereqs, file_path, "UNIT_")
+
         # Update tech data with unit unlocks
-        for tech in self.techs:
-            if tech["id"] in tech_units:
-                tech["unlocks"]["units"] = tech_units[tech["id"]]
-    
-    def parse_improvement_unlocks(self):
-        """Parse improvement.xml to find what improvements each tech unlocks"""
-        file_path = self.xml_dir / "improvement.xml"
-        if not file_path.exists():
-            print(f"Warning: {file_path} not found")
-            return
-            
-        # Improvements don't have direct tech prereqs in the XML
-        # I need to manually map based on the original data
-        manual_improvement_mapping = {
-            "TECH_STONECUTTING": ["Fort", "Quarry"],
-            "TECH_TRAPPING": ["Camp"],
-            "TECH_DIVINATION": ["Shrine"],
-            "TECH_ADMINISTRATION": ["Granary"],
-            "TECH_HUSBANDRY": ["Pasture"],
-            "TECH_DRAMA": ["Odeon"],
-            "TECH_POLIS": ["Hamlet"],
-            "TECH_MILITARY_DRILL": ["Barracks"],
-            "TECH_ARISTOCRACY": ["Kushite Pyramids"],
-            "TECH_FORESTRY": ["Lumbermill"],
-            "TECH_COINAGE": ["Market"],
-            "TECH_CITIZENSHIP": ["Courthouse"],
-            "TECH_ARCHITECTURE": ["Baths"],
-            "TECH_LAND_CONSOLIDATION": ["Grove"],
-            "TECH_COMPOSITE_BOW": ["Range"],
-            "TECH_MONASTICISM": ["Monastery"],
-            "TECH_SCHOLARSHIP": ["Library"],
-            "TECH_VAULTING": ["Cathedral"],
-            "TECH_DOCTRINE": ["Temple"],
-            "TECH_HYDRAULICS": ["Watermill"],
-            "TECH_WINDLASS": ["Windmill"],
-            "TECH_CARTOGRAPHY": ["Harbor"]
-        }
-        
-        for tech in self.techs:
-            if tech["id"] in manual_improvement_mapping:
-                tech["unlocks"]["improvements"] = manual_improvement_mapping[tech["id"]]
+        self._assign_unlocks("units", tech_units)
     
-    def parse_law_unlocks(self):
-        """Parse law.xml to find what laws each tech unlocks"""
-        file_path = self.xml_dir / "law.xml"
-        if not file_path.exists():
-            print(f"Warning: {file_path} not found")
+    def apply_manual_unlocks(self):
+        """Apply the hand-kept improvement and law unlocks in one pass.
+
+        Neither improvement.xml nor law.xml links back to techs, so the
+        tables in _MANUAL_UNLOCK_TABLES stand in for them. A kind is still
+        skipped (with a warning) when its game file is missing.
+        """
+        kinds = set()
+        for filename, kind, _ in _MANUAL_UNLOCK_TABLES:
+            file_path = self.xml_dir / filename
+            if self._exists(file_path):
+                kinds.add(kind)
+            else:
+                print(f"Warning: {file_path} not found")
+        if not kinds:
             return
-            
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        # Laws don't have direct tech prereqs, they're unlocked by law classes
-        # I need to manually map based on the original data
-        manual_law_mapping = {
-            "TECH_LABOR_FORCE": ["Slavery/Freedom"],
-            "TECH_ARISTOCRACY": ["Centralization/Vassalage"],
-            "TECH_RHETORIC": ["Epics/Exploration"],
-            "TECH_NAVIGATION": ["Colonies/Serfdom"],
-            "TECH_SOVEREIGNTY": ["Tyranny/Constitution"],
-            "TECH_CITIZENSHIP": ["Divine Rule/Legal Code"],
-            "TECH_ARCHITECTURE": ["Philosophy/Engineering"],
-            "TECH_MONASTICISM": ["Monotheism/Polytheism"],
-            "TECH_VAULTING": ["Iconography/Calligraphy"],
-            "TECH_MANOR": ["Professional Army/Volunteers"],
-            "TECH_DOCTRINE": ["Tolerance/Orthodoxy"],
-            "TECH_LATEEN_SAIL": ["Autarky/Trade League"],
-            "TECH_JURISPRUDENCE": ["Guilds/Elites"],
-            "TECH_MARTIAL_CODE": ["Pilgrimage/Holy War"],
-            "TECH_FISCAL_POLICY": ["Coin Debasement/Monetary Reform"]
-        }
-        
-        for tech in self.techs:
-            if tech["id"] in manual_law_mapping:
-                tech["unlocks"]["laws"] = manual_law_mapping[tech["id"]]
+
+        unlocks_by_id = self._unlocks_by_id
+        for tech_id, manual in _MANUAL_UNLOCKS.items():
+            unlocks = unlocks_by_id.get(tech_id)
+            if unlocks is None:
+                continue
+            for kind, items in manual.items():
+                if kind in kinds:
+                    unlocks[kind] = items
     
     def parse_project_unlocks(self):
         """Parse project.xml to find what projects each tech unlocks"""
         file_path = self.xml_dir / "project.xml"
-        if not file_path.exists():
+        if not self._exists(file_path):
             print(f"Warning: {file_path} not found")
             return
             
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        tech_projects = {}
-        for proj in root.findall(".//Entry"):
-            proj_type = proj.find("zType")
-            tech_prereq = proj.find("TechPrereq")
-            if proj_type is not None and proj_type.text and tech_prereq is not None and tech_prereq.text:
-                tech_id = tech_prereq.text
-                proj_name = self.format_name(proj_type.text, "PROJECT_")
-                if tech_id not in tech_projects:
-                    tech_projects[tech_id] = []
-                tech_projects[tech_id].append(proj_name)
-        
-        for tech in self.techs:
-            if tech["id"] in tech_projects:
-                tech["unlocks"]["projects"] = tech_projects[tech["id"]]
-    
-    def add_manual_unlock_data_OLD_REMOVED(self):
-        """DEPRECATED - Now parsing from game files directly"""
-        # Kept for reference only
-        manual_unlocks = {
-            "TECH_IRONWORKING": {"units": ["Warrior"], "improvements": [], "laws": [], "projects": []},
-            "TECH_STONECUTTING": {"units": [], "improvements": ["Fort", "Quarry"], "laws": [], "projects": []},
-            "TECH_TRAPPING": {"units": ["Slinger"], "improvements": ["Camp"], "laws": [], "projects": []},
-            "TECH_DIVINATION": {"units": [], "improvements": ["Shrine"], "laws": [], "projects": []},
-            "TECH_ADMINISTRATION": {"units": [], "improvements": ["Granary"], "laws": [], "projects": ["Treasury"]},
-            "TECH_LABOR_FORCE": {"units": [], "improvements": [], "laws": ["Slavery/Freedom"], "projects": []},
-            "TECH_HUSBANDRY": {"units": [], "improvements": ["Pasture"], "laws": [], "projects": []},
-            "TECH_DRAMA": {"units": [], "improvements": ["Odeon"], "laws": [], "projects": []},
-            "TECH_POLIS": {"units": [], "improvements": ["Hamlet"], "laws": [], "projects": ["Walls"]},
-            "TECH_MILITARY_DRILL": {"units": [], "improvements": ["Barracks"], "laws": [], "projects": []},
-            "TECH_ARISTOCRACY": {"units": [], "improvements": ["Kushite Pyramids"], "laws": ["Centralization/Vassalage"], "projects": []},
-            "TECH_RHETORIC": {"units": [], "improvements": [], "laws": ["Epics/Exploration"], "projects": ["Forum"]},
-            "TECH_NAVIGATION": {"units": ["Bireme"], "improvements": [], "laws": ["Colonies/Serfdom"], "projects": []},
-            "TECH_PHALANX": {"units": ["Spearman"], "improvements": [], "laws": [], "projects": []},
-            "TECH_SPOKED_WHEEL": {"units": ["Chariot"], "improvements": [], "laws": [], "projects": []},
-            "TECH_FORESTRY": {"units": [], "improvements": ["Lumbermill"], "laws": [], "projects": []},
-            "TECH_STEEL": {"units": ["Axeman"], "improvements": [], "laws": [], "projects": []},
-            "TECH_SOVEREIGNTY": {"units": [], "improvements": [], "laws": ["Tyranny/Constitution"], "projects": []},
-            "TECH_METAPHYSICS": {"units": [], "improvements": [], "laws": [], "projects": ["Archive"]},
-            "TECH_COINAGE": {"units": [], "improvements": ["Market"], "laws": [], "projects": []},
-            "TECH_CITIZENSHIP": {"units": [], "improvements": ["Courthouse"], "laws": ["Divine Rule/Legal Code"], "projects": []},
-            "TECH_PORTCULLIS": {"units": [], "improvements": [], "laws": [], "projects": ["Moat"]},
-            "TECH_ARCHITECTURE": {"units": [], "improvements": ["Baths"], "laws": ["Philosophy/Engineering"], "projects": []},
-            "TECH_LAND_CONSOLIDATION": {"units": ["Camel Archer"], "improvements": ["Grove"], "laws": [], "projects": []},
-            "TECH_COMPOSITE_BOW": {"units": [], "improvements": ["Range"], "laws": [], "projects": []},
-            "TECH_MONASTICISM": {"units": [], "improvements": ["Monastery"], "laws": ["Monotheism/Polytheism"], "projects": []},
-            "TECH_MACHINERY": {"units": ["Onager"], "improvements": [], "laws": [], "projects": []},
-            "TECH_SCHOLARSHIP": {"units": [], "improvements": ["Library"], "laws": [], "projects": []},
-            "TECH_STIRRUPS": {"units": ["Horseman", "Horse Archer"], "improvements": [], "laws": [], "projects": []},
-            "TECH_VAULTING": {"units": [], "improvements": ["Cathedral"], "laws": ["Iconography/Calligraphy"], "projects": []},
-            "TECH_MANOR": {"units": ["Conscript"], "improvements": [], "laws": ["Professional Army/Volunteers"], "projects": []},
-            "TECH_BATTLELINE": {"units": ["Maceman"], "improvements": [], "laws": [], "projects": []},
-            "TECH_DOCTRINE": {"units": [], "improvements": ["Temple"], "laws": ["Tolerance/Orthodoxy"], "projects": []},
-            "TECH_HYDRAULICS": {"units": ["Ballista"], "improvements": ["Mill"], "laws": [], "projects": []},
-            "TECH_CARTOGRAPHY": {"units": [], "improvements": ["Harbor"], "laws": [], "projects": []},
-            "TECH_LATEEN_SAIL": {"units": ["Dromon"], "improvements": [], "laws": ["Autarky/Trade League"], "projects": []},
-            "TECH_JURISPRUDENCE": {"units": [], "improvements": [], "laws": ["Guilds/Elites"], "projects": []},
-            "TECH_MARTIAL_CODE": {"units": [], "improvements": [], "laws": ["Pilgrimage/Holy War"], "projects": ["Towers"]},
-            "TECH_BODKIN_ARROW": {"units": ["Longbowman"], "improvements": [], "laws": [], "projects": []},
-            "TECH_WINDLASS": {"units": ["Crossbowman"], "improvements": [], "laws": [], "projects": []},
-            "TECH_FISCAL_POLICY": {"units": [], "improvements": [], "laws": ["Coin Debasement/Monetary Reform"], "projects": []},
-            "TECH_BARDING": {"units": ["Cataphract"], "improvements": [], "laws": [], "projects": []},
-            "TECH_COHORTS": {"units": ["Swordsman"], "improvements": [], "laws": [], "projects": []},
-            "TECH_INFANTRY_SQUARE": {"units": ["Pikeman"], "improvements": [], "laws": [], "projects": []},
-            "TECH_CHAIN_DRIVE": {"units": ["Polybolos"], "improvements": [], "laws": [], "projects": []},
-            "TECH_BALLISTICS": {"units": ["Mangonel"], "improvements": [], "laws": [], "projects": []},
-        }
-        
-        # Update tech unlocks with manual data
-        for tech in self.techs:
-            if tech["id"] in manual_unlocks:
-                tech["unlocks"] = manual_unlocks[tech["id"]]
+        tech_projects = self._load(_load_tech_prereqs, file_path, "PROJECT_")
+        self._assign_unlocks("projects", tech_projects)
     
-    def get_int_value(self, node, tag: str, default: int = 0) -> int:
-        """Safely get integer value from XML node"""
-        elem = node.find(tag)
-        if elem is not None and elem.text:
-            try:
-                return int(elem.text)
-            except ValueError:
-                pass
+    @staticmethod
+    def get_int_value(fields: Dict, tag: str, default: int = 0) -> int:
+        """Safely get integer value from a node's {tag: child} map"""
+        elem = fields.get(tag)
+        if elem is not None:
+            text = elem.text
+            if text:
+                try:
+                    return int(text)
+                except ValueError:
+                    pass
         return default
     
-    def get_bool_value(self, node, tag: str) -> bool:
-        """Safely get boolean value from XML node"""
-        elem = node.find(tag)
-        if elem is None:
-            return False
+    @staticmethod
+    def get_bool_value(fields: Dict, tag: str) -> bool:
+        """Safely get boolean value from a node's {tag: child} map"""
+        elem = fields.get(tag)
         # Check both attribute and text content
-        value = elem.get("value") or elem.text
-        return value == "1"
+        return elem is not None and (elem.get("value") or elem.text) == "1"
     
     def export_data(self) -> Dict:
         """Export parsed data as dictionary for JSON conversion"""
@@ -958,55 +1162,159 @@ def fetch_game_version() -> str:
     return ""
 
 
-def generate_tech_data_js(data: Dict, output_path: str = "tech-data.js"):
+# Unlock kinds the frontend renders, in tech-data.js order (a subset of
+# UNLOCK_KINDS).
+JS_UNLOCK_KINDS = ("units", "improvements", "laws", "projects")
+
+
+# One reusable encoder for _js_object: json.dumps with any non-default
+# option builds a fresh JSONEncoder on every call.
+_js_value = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _js_object(fields: Dict[str, Any],
+               list_memo: Optional[Dict[Tuple, str]] = None) -> str:
+    """Render a dict as a one-line JS object literal with bare keys.
+
+    Nested dicts become nested literals; every other value is JSON, which is
+    valid JS and takes care of quoting and escaping. Pass list_memo to reuse
+    the encoding of repeated lists of scalars (empty unlock lists, shared
+    prereqs) across calls.
+    """
+    parts = []
+    for key, value in fields.items():
+        if isinstance(value, dict):
+            parts.append(f"{key}: {_js_object(value, list_memo)}")
+        elif list_memo is not None and isinstance(value, (list, tuple)):
+            memo_key = tuple(value)
+            text = list_memo.get(memo_key)
+            if text is None:
+                text = list_memo[memo_key] = _js_value(value)
+            parts.append(f"{key}: {text}")
+        else:
+            parts.append(f"{key}: {_js_value(value)}")
+    return "{ " + ", ".join(parts) + " }"
+
+
+def _dumps_indented(obj: Any) -> str:
+    """JSON with a 2-space indent, non-ASCII left as UTF-8."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _dumps_indented_bytes(obj: Any) -> bytes:
+    """_dumps_indented as UTF-8 bytes, for writing straight to a file.
+
+    orjson already produces bytes, so this skips its decode/encode round trip.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+_DATA_HASH_PREFIX = "// data-hash: "
+
+
+def _data_hash(data: Dict, game_version: str) -> str:
+    """Digest of everything tech-data.js is built from except the date.
+
+    Covers the parsed data, the game version string, VERSION_HISTORY and
+    the contents of this script, so an edit to the emitter also counts as a
+    change while a fresh checkout of the same code does not.
+    """
+    payload = json.dumps([data, game_version, VERSION_HISTORY], sort_keys=True,
+                         ensure_ascii=False)
+    h = hashlib.blake2b(payload.encode("utf-8"), digest_size=16)
+    try:
+        h.update(Path(__file__).read_bytes())
+    except OSError:
+        pass
+    return h.hexdigest()
+
+
+def _existing_data_hash(out: Path) -> Optional[str]:
+    """The data-hash recorded in the header of an existing output file."""
+    try:
+        with out.open(encoding="utf-8") as f:
+            for _ in range(5):
+                line = f.readline()
+                if line.startswith(_DATA_HASH_PREFIX):
+                    return line[len(_DATA_HASH_PREFIX):].strip()
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
+
+def generate_tech_data_js(data: Dict, output_path: str = "tech-data.js",
+                          force: bool = False, game_version: Optional[str] = None):
     """Emit tech-data.js consumed by index.html and phone.html.
 
     Exposes window.techData, window.nationData (with nationNames as a list of
     {id, name}), window.nationLookup, window.currentVersionHash,
     window.versionMaps, and window.gameVersion.
+
+    The header records a hash of the input data and game version. When the
+    existing file already carries the same hash it is not rewritten (unless
+    force is set), which keeps the "Generated" date and the file's mtime
+    stable. It is not a speedup: hashing costs a good share of rendering. Pass
+    game_version to use an already fetched version string instead of
+    looking it up here.
     """
     out = Path(output_path)
-    if out.parent and not out.parent.exists():
-        print(f"Error: parent directory {out.parent} does not exist")
-        return False
 
+    if game_version is None:
+        game_version = fetch_game_version()
+    game_version = game_version or "Old World"
+
+    data_hash = _data_hash(data, game_version)
+    if not force and _existing_data_hash(out) == data_hash:
+        print(f"{out} unchanged")
+        return True
+
+    list_memo: Dict[Tuple, str] = {}
     tech_entries = []
     for tech in data["techs"]:
-        unlocks = tech.get("unlocks", {})
-        tech_entries.append(
-            f'    {{ id: "{tech["id"]}", name: "{tech["name"]}", '
-            f'cost: {tech["cost"]}, column: {tech["column"]}, row: {tech["row"]}, '
-            f'prereqs: {json.dumps(tech["prereqs"])}, '
-            f'unlocks: {{ units: {json.dumps(unlocks.get("units", []))}, '
-            f'improvements: {json.dumps(unlocks.get("improvements", []))}, '
-            f'laws: {json.dumps(unlocks.get("laws", []))}, '
-            f'projects: {json.dumps(unlocks.get("projects", []))} }} }}'
-        )
+        # parse_tech_node gives every tech all UNLOCK_KINDS up front.
+        unlocks = tech["unlocks"]
+        tech_entries.append("    " + _js_object({
+            "id": tech["id"],
+            "name": tech["name"],
+            "cost": tech["cost"],
+            "column": tech["column"],
+            "row": tech["row"],
+            "prereqs": tech["prereqs"],
+            "unlocks": {kind: unlocks[kind] for kind in JS_UNLOCK_KINDS},
+        }, list_memo))
 
     bonus_entries = []
     for bonus in data["bonusTechs"]:
-        parts = [
-            f'id: "{bonus["id"]}"',
-            f'name: "{bonus["name"]}"',
-            f'cost: {bonus["cost"]}',
-            f'parent: "{bonus.get("parent", "") or ""}"',
-            f'bonus: "{bonus.get("bonus", "")}"',
-        ]
-        if bonus.get("nation"):
-            parts.append(f'nation: "{bonus["nation"]}"')
-        if bonus.get("cultureRequired"):
-            parts.append(f'cultureRequired: "{bonus["cultureRequired"]}"')
-        if bonus.get("iconName"):
-            parts.append(f'iconName: "{bonus["iconName"]}"')
-        bonus_entries.append("    { " + ", ".join(parts) + " }")
+        get = bonus.get
+        fields = {
+            "id": bonus["id"],
+            "name": bonus["name"],
+            "cost": bonus["cost"],
+            "parent": get("parent") or "",
+            "bonus": get("bonus", ""),
+        }
+        for optional in ("nation", "cultureRequired", "iconName"):
+            value = get(optional)
+            if value:
+                fields[optional] = value
+        bonus_entries.append("    " + _js_object(fields))
 
     nation_names_list = [
         {"id": nid, "name": name}
         for nid, name in data["nationData"]["nationNames"].items()
     ]
     nation_lookup = list(data["nationData"]["nationNames"].keys())
+    nation_data = {
+        "startingTechs": data["nationData"]["startingTechs"],
+        "nationNames": nation_names_list,
+        "nationSpecificBonuses": data["nationData"]["nationSpecificBonuses"],
+        "colors": data["nationData"].get("colors", {}),
+    }
 
-    game_version = fetch_game_version() or "Old World"
     generated_date = datetime.now().strftime("%b %d, %Y")
     version_string = f"{game_version} | Generated {generated_date}"
 
@@ -1014,7 +1322,8 @@ def generate_tech_data_js(data: Dict, output_path: str = "tech-data.js"):
 
     body = (
         "// Auto-generated tech data for the redesigned tech tree — do not edit by hand.\n"
-        "// Regenerate via `python3 generate_tech_tree.py --xml-dir XML/Infos`.\n\n"
+        "// Regenerate via `python3 generate_tech_tree.py --xml-dir XML/Infos`.\n"
+        f"{_DATA_HASH_PREFIX}{data_hash}\n\n"
         f"window.gameVersion = {json.dumps(version_string)};\n\n"
         "window.techData = {\n"
         "  techs: [\n"
@@ -1024,19 +1333,26 @@ def generate_tech_data_js(data: Dict, output_path: str = "tech-data.js"):
         + ",\n".join(bonus_entries) + "\n"
         "  ]\n"
         "};\n\n"
-        f"window.nationLookup = {json.dumps(nation_lookup, indent=2)};\n\n"
-        "window.nationData = {\n"
-        f"  startingTechs: {json.dumps(data['nationData']['startingTechs'], indent=2)},\n"
-        f"  nationNames: {json.dumps(nation_names_list, indent=2)},\n"
-        f"  nationSpecificBonuses: {json.dumps(data['nationData']['nationSpecificBonuses'], indent=2)},\n"
-        f"  colors: {json.dumps(data['nationData'].get('colors', {}), indent=2)}\n"
-        "};\n\n"
+        f"window.nationLookup = {_dumps_indented(nation_lookup)};\n\n"
+        f"window.nationData = {_dumps_indented(nation_data)};\n\n"
         f"window.currentVersionHash = {json.dumps(version_hash)};\n"
         f"window.versionMaps = {json.dumps(VERSION_HISTORY)};\n"
     )
 
-    with open(out, "w") as f:
-        f.write(body)
+    new_bytes = body.encode("utf-8")
+    try:
+        # Leave an identical file untouched so its mtime doesn't wake up
+        # watchers or caches downstream (e.g. after --force on the same day).
+        if out.read_bytes() == new_bytes:
+            print(f"{out} unchanged")
+            return True
+    except OSError:
+        pass
+    try:
+        out.write_bytes(new_bytes)
+    except FileNotFoundError:
+        print(f"Error: parent directory {out.parent} does not exist")
+        return False
     print(f"Generated {out}")
     return True
 
@@ -1058,29 +1374,46 @@ def main():
         "--export-json",
         help="Also export parsed data to JSON for debugging"
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Cache parsed XML here (e.g. .cache) to speed up repeated runs"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite the output even if its data-hash says nothing changed"
+    )
 
     args = parser.parse_args()
 
     # Check if XML directory exists
-    if not Path(args.xml_dir).exists():
+    if not os.path.isdir(args.xml_dir):
         print(f"Error: XML directory {args.xml_dir} not found")
         print("Please ensure you have the Old World game files in the correct location")
         return 1
 
-    # Parse the XML files
-    p = OldWorldParser(args.xml_dir)
-    p.parse_all()
+    # Read the large files in worker processes first: forking once another
+    # thread is running can deadlock the children.
+    p = OldWorldParser(args.xml_dir, cache_dir=args.cache_dir)
+    p.prefetch()
 
-    # Export the data
-    data = p.export_data()
+    # The gh lookup is network-bound, so let it run while the XML is parsed.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        version_future = pool.submit(fetch_game_version)
 
-    if args.export_json:
-        with open(args.export_json, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"Exported data to {args.export_json}")
+        # Parse the XML files
+        p.parse_all(prefetch=False)
 
-    if not generate_tech_data_js(data, args.output):
-        return 1
+        # Export the data
+        data = p.export_data()
+
+        if args.export_json:
+            Path(args.export_json).write_bytes(_dumps_indented_bytes(data))
+            print(f"Exported data to {args.export_json}")
+
+        if not generate_tech_data_js(data, args.output, force=args.force,
+                                     game_version=version_future.result()):
+            return 1
 
     print("Tech tree generation complete!")
     return 0
@@ -5,8 +5,11 @@ Tests for the Old World Tech Tree parser and tech-data.js emitter.
 
 import os
 import re
+import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
+from unittest import mock
 
 from generate_tech_tree import (
     OldWorldParser,
@@ -293,6 +296,153 @@ class TestVersionHash(unittest.TestCase):
         self.assertNotEqual(h1, h2)
 
 
+class TestLoaderCache(unittest.TestCase):
+    """The --cache-dir pickle cache round-trips and notices edited XML."""
+
+    TEXT_XML = ('<Root><Entry><zType>TEXT_TECH_X</zType>'
+                '<en-US>{}</en-US></Entry></Root>')
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.xml_dir = Path(tmp.name) / "xml"
+        self.cache_dir = Path(tmp.name) / "cache"
+        self.xml_dir.mkdir()
+        self.text_file = self.xml_dir / "text-infos.xml"
+        self.text_file.write_text(self.TEXT_XML.format("Writing"))
+
+    def load_texts(self):
+        parser = OldWorldParser(str(self.xml_dir), cache_dir=str(self.cache_dir))
+        parser.parse_text_files()
+        return parser.text_data
+
+    def test_second_run_reads_cache(self):
+        self.assertEqual(self.load_texts(), {"TEXT_TECH_X": "Writing"})
+        self.assertEqual(len(list(self.cache_dir.glob("*.pkl"))), 1)
+        self.assertEqual(self.load_texts(), {"TEXT_TECH_X": "Writing"})
+
+    def test_edited_file_invalidates_cache(self):
+        self.load_texts()
+        self.text_file.write_text(self.TEXT_XML.format("Scripture"))
+        os.utime(self.text_file, ns=(1, 1))
+        self.assertEqual(self.load_texts(), {"TEXT_TECH_X": "Scripture"})
+        # The stale entry is replaced, not accumulated.
+        self.assertEqual(len(list(self.cache_dir.glob("*.pkl"))), 1)
+
+
+class TestSharedEffectUnlocks(unittest.TestCase):
+    """Techs sharing an EffectPlayer don't leak unlocks into each other."""
+
+    FILES = {
+        "effectPlayer.xml": (
+            "<Root><Entry><zType>EFFECTPLAYER_SHARED</zType>"
+            "<aeUnitUnlock><zValue>UNIT_WARRIOR</zValue></aeUnitUnlock>"
+            "</Entry></Root>"),
+        "tech.xml": (
+            "<Root>"
+            "<Entry><zType>TECH_A</zType><EffectPlayer>EFFECTPLAYER_SHARED</EffectPlayer></Entry>"
+            "<Entry><zType>TECH_B</zType><EffectPlayer>EFFECTPLAYER_SHARED</EffectPlayer></Entry>"
+            "</Root>"),
+        "unit.xml": (
+            "<Root><Entry><zType>UNIT_SPEARMAN</zType>"
+            "<TechPrereq>TECH_A</TechPrereq></Entry></Root>"),
+        "project.xml": (
+            "<Root><Entry><zType>PROJECT_WALLS</zType>"
+            "<TechPrereq>TECH_B</TechPrereq></Entry></Root>"),
+    }
+
+    def test_each_tech_keeps_its_own_unlocks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, xml in self.FILES.items():
+                (Path(tmp) / name).write_text(xml)
+            parser = OldWorldParser(tmp)
+            parser.parse_effect_player()
+            parser.parse_techs()
+            parser.parse_unit_unlocks()
+            parser.parse_project_unlocks()
+        unlocks = {t["id"]: t["unlocks"] for t in parser.techs}
+        self.assertEqual(list(unlocks["TECH_A"]["units"]), ["Spearman"])
+        self.assertEqual(list(unlocks["TECH_A"]["projects"]), [])
+        self.assertEqual(list(unlocks["TECH_B"]["units"]), ["Warrior"])
+        self.assertEqual(list(unlocks["TECH_B"]["projects"]), ["Walls"])
+
+
+class TestJsEscaping(unittest.TestCase):
+    """Quotes and backslashes in names and bonus text stay valid JS."""
+
+    def test_bonus_strings_are_escaped(self):
+        data = {
+            "techs": [],
+            "bonusTechs": [{"id": "TECH_X_BONUS", "name": 'The "Great" \\ Wall',
+                            "cost": 10, "parent": None, "bonus": "+1 \\ turn"}],
+            "nationData": {"nationNames": {}, "startingTechs": {},
+                           "nationSpecificBonuses": {}},
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "tech-data.js"
+            generate_tech_data_js(data, output_path=str(out), game_version="Old World")
+            js = out.read_text()
+        self.assertIn('name: "The \\"Great\\" \\\\ Wall"', js)
+        self.assertIn('bonus: "+1 \\\\ turn"', js)
+
+
+class TestUnchangedOutputSkipped(unittest.TestCase):
+    """tech-data.js is only rewritten when its data-hash changes."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out = Path(tmp.name) / "tech-data.js"
+        self.data = {
+            "techs": [],
+            "bonusTechs": [],
+            "nationData": {"nationNames": {"NATION_ROME": "Rome"},
+                           "startingTechs": {}, "nationSpecificBonuses": {}},
+        }
+        patcher = mock.patch("generate_tech_tree.fetch_game_version",
+                             return_value="Old World v1.0")
+        self.fetch = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Pin the "Generated <date>" stamp so runs straddling midnight
+        # still produce identical bytes.
+        patcher = mock.patch("generate_tech_tree.datetime")
+        patcher.start().now.return_value = datetime(2026, 2, 18)
+        self.addCleanup(patcher.stop)
+
+    def test_same_data_skips_rewrite(self):
+        self.assertTrue(generate_tech_data_js(self.data, output_path=str(self.out)))
+        self.out.write_text(self.out.read_text() + "// marker\n")
+        self.assertTrue(generate_tech_data_js(self.data, output_path=str(self.out)))
+        self.assertIn("// marker", self.out.read_text())
+
+    def test_changed_data_or_force_rewrites(self):
+        generate_tech_data_js(self.data, output_path=str(self.out))
+        self.data["nationData"]["nationNames"]["NATION_EGYPT"] = "Egypt"
+        generate_tech_data_js(self.data, output_path=str(self.out))
+        self.assertIn("NATION_EGYPT", self.out.read_text())
+        self.out.write_text(self.out.read_text() + "// marker\n")
+        generate_tech_data_js(self.data, output_path=str(self.out), force=True)
+        self.assertNotIn("// marker", self.out.read_text())
+
+    def test_new_game_version_rewrites(self):
+        generate_tech_data_js(self.data, output_path=str(self.out))
+        self.fetch.return_value = "Old World v1.1"
+        generate_tech_data_js(self.data, output_path=str(self.out))
+        self.assertIn('"Old World v1.1 | Generated', self.out.read_text())
+
+    def test_identical_output_is_not_rewritten(self):
+        generate_tech_data_js(self.data, output_path=str(self.out))
+        os.utime(self.out, ns=(1, 1))
+        generate_tech_data_js(self.data, output_path=str(self.out), force=True)
+        self.assertEqual(self.out.stat().st_mtime_ns, 1)
+
+    def test_prefetched_game_version_is_used(self):
+        generate_tech_data_js(self.data, output_path=str(self.out),
+                              game_version="Old World v2.0")
+        self.assertIn('"Old World v2.0 | Generated', self.out.read_text())
+        self.fetch.assert_not_called()
+
+
 class TestStaticAssetsPresent(unittest.TestCase):
     """Sanity check that the deployable assets exist at the repo root."""
 